@@ -25,12 +25,15 @@ headers = {
 response = requests.get(url, headers=headers, impersonate="chrome120", timeout=30)
 
 if response.status_code == 200:
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(response.text, 'lxml')
     entry_list = soup.find('ul', {'id': 'entry-item-list'})
     
     if entry_list:
+        # Tüm li elementlerini bir kez bul, aşağıda tekrar kullan
+        all_li = entry_list.find_all('li')
+        
         # İlk birkaç li elementini kontrol et
-        li_elements = entry_list.find_all('li')[:2]  # İlk 2 li elementi al
+        li_elements = all_li[:2]  # İlk 2 li elementi al
         
         print("Li elementi örnekleri:")
         print("-" * 60)
@@ -62,7 +65,7 @@ if response.status_code == 200:
         print(f"li[data-id]: {len(test2)} adet")
         
         # 3. Doğrudan li elementi
-        test3 = entry_list.find_all('li')
+        test3 = all_li
         print(f"Tüm li: {len(test3)} adet")
         
         # İlk entry'nin HTML'ini göster
@@ -8,35 +8,121 @@ Supports both CLI and programmatic usage.
 
 Usage:
     CLI:
-        python eksiscraper.py <url> [--delay <ms>] [--silent] [--output <filename>]
+        python eksiscraper.py <url> [--delay <ms>] [--concurrency <n>] [--fast-parse] [--silent] [--output <filename>]
+                              [--format {csv,parquet,feather}]
     
     Module:
         import eksiscraper
-        scraper = eksiscraper.EksiScraper(delay_ms=2000, verbose=True)
-        df = scraper.scrape("https://eksisozluk.com/baslik--123")
-        scraper.save_to_csv(df)
+        with eksiscraper.EksiScraper(delay_ms=2000, verbose=True) as scraper:
+            df = scraper.scrape("https://eksisozluk.com/baslik--123")
+            scraper.save_to_csv(df)
 
 Author: EksiScraper Module
 License: MIT
 """
 
 import argparse
+import asyncio
+import csv
+import functools
+import gzip
+import html as html_lib
+import importlib.util
+import io
 import logging
+import math
+import re
 import sys
 import time
+import weakref
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import compress
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import IO, Callable, Dict, List, Literal, Optional, Tuple
 
-from curl_cffi import requests
+from curl_cffi import CurlHttpVersion
+from curl_cffi.requests import AsyncSession
 import pandas as pd
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
+
+
+# Headers for curl_cffi - mimics modern Chrome browser
+_DEFAULT_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Accept-Language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Cache-Control': 'no-cache',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Upgrade-Insecure-Requests': '1',
+    'DNT': '1'
+}
+
+# Filename sanitization for topic titles: hyphens and spaces become
+# underscores, Windows-invalid characters (< > : " / \ | ? *) are removed
+_FILENAME_TRANS = str.maketrans({'-': '_', ' ': '_', **dict.fromkeys('<>:"/\\|?*')})
+
+# Start tags of the only page regions the parser needs. Parsing from these
+# offsets keeps Lexbor from building nodes for the header, navigation and
+# topic index that precede them.
+_ENTRY_LIST_START_RE = re.compile(rb'<ul\b[^>]*\bid="entry-item-list"')
+_PAGER_START_RE = re.compile(rb'<div\b[^>]*\bclass="(?:[^"]*\s)?pager[\s"]')
+
+# The page count is a single attribute on div.pager; matching it on the raw
+# HTML avoids parsing the page at all.
+_PAGECOUNT_RE = re.compile(rb'data-pagecount="(\d+)"')
+
+# Opt-in regex parser (fast_parse): entry start tags, their attributes, and
+# the content / date fragments inside each entry block
+_ENTRY_START_RE = re.compile(rb'<li\b([^>]*\bid="entry-item"[^>]*)>')
+_ATTR_RE = re.compile(rb'([\w-]+)="([^"]*)"')
+_CONTENT_RE = re.compile(rb'<div\b[^>]*\bclass="(?:[^"]*\s)?content[\s"][^>]*>(.*?)</div>', re.DOTALL)
+_DATE_RE = re.compile(rb'<a\b[^>]*\bclass="(?:[^"]*\s)?entry-date[\s"][^>]*>(.*?)</a>', re.DOTALL)
+_UL_TAG_RE = re.compile(rb'<(/?)ul\b')
+# A tag or comment; quoted attribute values may contain '>', and a '<' not
+# followed by a tag name is text (as in the HTML parser)
+_TAG_RE = re.compile(r'<(?:!--.*?--|[/!]?[a-zA-Z](?:"[^"]*"|\'[^\']*\'|[^\'">])*)>', re.DOTALL)
+
+# Column order of the CSV output (same as the DataFrame built by scrape())
+_ENTRY_FIELDS = ['entry_id', 'author', 'author_id', 'favorite_count', 'page_number', 'content', 'date']
+
+# Output formats supported by save_to_csv() and their file extensions
+OUTPUT_FORMATS = {'csv': 'csv', 'parquet': 'parquet', 'feather': 'feather'}
+
+# Rows serialized per batch by DataFrame.to_csv, bounding the writer's buffer
+_CSV_CHUNKSIZE = 100_000
+
+# Data file extension (optionally compressed) replaced to name the error file
+_DATA_SUFFIX_RE = re.compile(r'(\.csv)?(\.\w+)?$')
+
+
+@functools.lru_cache(maxsize=1)
+def _console_stream() -> IO[str]:
+    """
+    UTF-8 console stream (to support emojis), created once per process.
+    
+    Wrapping sys.stdout.buffer again for every logger would leave orphaned
+    wrappers that close stdout when they are garbage collected.
+    
+    Returns:
+        Text stream writing UTF-8 to stdout
+    """
+    if not hasattr(sys.stdout, 'buffer'):
+        return sys.stdout
+    return io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 
 def setup_logger(verbose: bool = True) -> logging.Logger:
     """
     Set up and configure logger.
     
+    Handlers are attached only once per process; later calls (e.g. one per
+    EksiScraper instance) just update the console verbosity.
+    
     Args:
         verbose: If True, show info logs. If False, only show warnings and errors.
     
@@ -45,9 +131,14 @@ def setup_logger(verbose: bool = True) -> logging.Logger:
     """
     logger = logging.getLogger(__name__)
     logger.setLevel(logging.DEBUG)
+    console_level = logging.INFO if verbose else logging.WARNING
     
-    # Clear existing handlers
-    logger.handlers.clear()
+    # Already configured - keep the handlers, don't reopen the log file
+    if logger.handlers:
+        for handler in logger.handlers:
+            if not isinstance(handler, logging.FileHandler):
+                handler.setLevel(console_level)
+        return logger
     
     # Create formatters
     file_formatter = logging.Formatter(
@@ -67,47 +158,179 @@ def setup_logger(verbose: bool = True) -> logging.Logger:
     logger.addHandler(file_handler)
     
     # Console handler - respect verbose setting
-    # Use utf-8 encoding for console to support emojis
-    import io
-    console_handler = logging.StreamHandler(io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8'))
-    console_handler.setLevel(logging.INFO if verbose else logging.WARNING)
+    console_handler = logging.StreamHandler(_console_stream())
+    console_handler.setLevel(console_level)
     console_handler.setFormatter(console_formatter)
     logger.addHandler(console_handler)
     
     return logger
 
 
+def _to_int(value: Optional[str], default: Optional[int] = None) -> Optional[int]:
+    """
+    Convert a numeric HTML attribute to int.
+    
+    Args:
+        value: Attribute value (may be missing or malformed)
+        default: Returned when the value is missing or not a number
+    
+    Returns:
+        Parsed integer, or default
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _has_pyarrow() -> bool:
+    """
+    Check whether pyarrow (needed for Parquet/Feather output) is installed.
+    """
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+def _fragment_text(fragment: bytes) -> str:
+    """
+    Extract the text of an HTML fragment, like ``node.text(strip=True)``.
+    
+    Every text run between tags is unescaped and stripped, then the runs are
+    concatenated.
+    
+    Args:
+        fragment: Raw HTML bytes of the element's inner HTML
+    
+    Returns:
+        Plain text content
+    """
+    text = fragment.decode('utf-8', 'replace')
+    return ''.join(html_lib.unescape(part).strip() for part in _TAG_RE.split(text))
+
+
+def _run_on_loop(loop: asyncio.AbstractEventLoop, coro):
+    """
+    Run a coroutine to completion on ``loop``.
+    
+    If the caller already has an event loop running in this thread (e.g.
+    Jupyter), ``loop`` is driven from a worker thread instead, since a second
+    loop cannot run in the same thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return loop.run_until_complete(coro)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(loop.run_until_complete, coro).result()
+
+
+def _close_session(loop: asyncio.AbstractEventLoop, session: AsyncSession) -> None:
+    """
+    Close a scraper's HTTP session, then the private event loop it is bound to.
+    
+    Module-level so it can serve as the scraper's finalizer without keeping
+    the scraper itself alive.
+    """
+    if loop.is_closed():
+        return
+    _run_on_loop(loop, session.close())
+    loop.close()
+
+
+class TokenBucket:
+    """
+    Asyncio token-bucket rate limiter.
+    
+    Holds up to ``capacity`` tokens, refilled at ``refill_rate`` tokens per
+    second; each request takes one token. An infinite refill rate disables
+    limiting.
+    """
+    
+    def __init__(self, capacity: float, refill_rate: float, tokens: Optional[float] = None):
+        """
+        Initialize the bucket.
+        
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            refill_rate: Tokens added per second
+            tokens: Initial number of tokens (default: full bucket)
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity if tokens is None else tokens
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if math.isinf(self.refill_rate):
+            self._tokens = self.capacity
+        else:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+    
+    async def acquire(self) -> None:
+        """
+        Wait until a token is available and take it.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                if math.isinf(self.refill_rate):
+                    return
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.refill_rate)
+    
+    def set_rate(self, refill_rate: float) -> None:
+        """
+        Change the refill rate, keeping tokens accrued at the old rate.
+        """
+        self._refill()
+        self.refill_rate = refill_rate
+    
+    def pause(self, seconds: float) -> None:
+        """
+        Hand out no tokens for the next ``seconds`` seconds.
+        """
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
 class EksiScraper:
     """
     Ekşi Sözlük scraper class for extracting entries from topics.
     """
     
-    def __init__(self, delay_ms: int = 2000, verbose: bool = True):
+    def __init__(
+        self,
+        delay_ms: int = 2000,
+        verbose: bool = True,
+        concurrency: int = 8,
+        fast_parse: bool = False
+    ):
         """
         Initialize the Ekşi Sözlük scraper.
 
         Args:
-            delay_ms: Delay between requests in milliseconds (default: 2000ms)
+            delay_ms: Minimum delay between request starts in milliseconds (default: 2000ms)
             verbose: If True, show info logs. If False, only show warnings and errors.
+            concurrency: Maximum number of requests in flight at the same time (default: 8)
+            fast_parse: If True, extract entries with regular expressions instead of
+                building a DOM, falling back to the HTML parser when the markup
+                does not match (default: False)
         """
         self.delay_seconds = delay_ms / 1000.0
         self.verbose = verbose
+        self.concurrency = max(1, concurrency)
+        self.fast_parse = fast_parse
         self.logger = setup_logger(verbose)
 
-        # Headers for curl_cffi - mimics modern Chrome browser
-        self.headers = {
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-            'Accept-Language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Cache-Control': 'no-cache',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'Upgrade-Insecure-Requests': '1',
-            'DNT': '1'
-        }
-
         # Storage for scraped data
         self.entries: List[Dict] = []
         self.errors: List[Dict] = []
@@ -116,7 +339,34 @@ class EksiScraper:
         self.topic_title: Optional[str] = None
         self.total_pages: int = 0
 
-        self.logger.info(f"🚀 EksiScraper initialized (delay: {delay_ms}ms, verbose: {verbose})")
+        # Running summary totals of the last scrape_to_csv() call
+        self._author_counts: Counter = Counter()
+        self._streamed_entries: int = 0
+        self._streamed_favorites: int = 0
+
+        # HTTP session shared by every request of this scraper (connection reuse);
+        # browser headers and the Chrome 120 fingerprint are set once here.
+        # It is bound to a private event loop so it survives across scrape() calls.
+        # HTTP/2 over TLS lets concurrent page requests share one multiplexed
+        # connection to the host.
+        self._loop = asyncio.new_event_loop()
+        self.session = AsyncSession(
+            loop=self._loop,
+            impersonate="chrome120",
+            headers=_DEFAULT_HEADERS,
+            http_version=CurlHttpVersion.V2TLS,
+            max_clients=self.concurrency,
+        )
+        # Release the session and loop even if close() is never called
+        self._finalizer = weakref.finalize(self, _close_session, self._loop, self.session)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._rate_limiter: Optional[TokenBucket] = None
+        self._max_request_rate: float = math.inf
+
+        self.logger.info(
+            f"🚀 EksiScraper initialized "
+            f"(delay: {delay_ms}ms, concurrency: {self.concurrency}, verbose: {verbose})"
+        )
     
     def _clean_url(self, url: str) -> str:
         """
@@ -157,14 +407,9 @@ class EksiScraper:
             else:
                 title = path
 
-            # Replace hyphens with spaces, then spaces with underscores
-            title = title.replace('-', ' ').replace(' ', '_')
-
-            # Remove invalid filename characters
-            # Windows invalid chars: < > : " / \ | ? *
-            invalid_chars = '<>:"/\\|?*'
-            for char in invalid_chars:
-                title = title.replace(char, '')
+            # Turn hyphens and spaces into underscores and drop invalid
+            # filename characters in a single pass
+            title = title.translate(_FILENAME_TRANS)
 
             # Remove any leading/trailing underscores or dots
             title = title.strip('_. ')
@@ -183,7 +428,7 @@ class EksiScraper:
             self.logger.warning(f"⚠️  Could not extract topic title: {str(e)}")
             return 'topic'
     
-    def _fetch_page(self, url: str, page_num: int, max_retries: int = 3) -> Optional[str]:
+    async def _fetch_page(self, url: str, page_num: int, max_retries: int = 3) -> Optional[bytes]:
         """
         Fetch a single page with retry logic.
         
@@ -193,31 +438,36 @@ class EksiScraper:
             max_retries: Maximum number of retry attempts
             
         Returns:
-            HTML content if successful, None otherwise
+            Raw HTML bytes if successful, None otherwise
         """
         for attempt in range(max_retries):
             try:
-                # Rate limiting (except for first page on first attempt)
-                if page_num > 1 or attempt > 0:
-                    self.logger.info(f"⏳ Waiting {self.delay_seconds:.1f}s...")
-                    time.sleep(self.delay_seconds)
+                # At most `concurrency` requests in flight
+                async with self._semaphore:
+                    # Rate limiting - take a token only once we may send, so
+                    # queued requests can't bank tokens and burst out later
+                    await self._rate_limiter.acquire()
 
-                # Make request with curl_cffi (impersonate Chrome 120)
-                response = requests.get(url, headers=self.headers, impersonate="chrome120", timeout=30)
+                    # Make request on the shared session (impersonates Chrome 120)
+                    response = await self.session.get(url, timeout=30)
+                
+                self._apply_rate_limit_headers(response.headers)
                 
                 # Handle response status codes
                 if response.status_code == 200:
                     self.logger.info(f"✅ Page {page_num} fetched successfully")
-                    return response.text
+                    return response.content
                 
                 elif response.status_code == 429:
-                    # Rate limit - exponential backoff
-                    wait_time = (attempt + 1) * 10
+                    # Rate limit - honour Retry-After, else exponential backoff.
+                    # Pausing the bucket holds back every pending request.
+                    retry_after = response.headers.get('Retry-After', '')
+                    wait_time = int(retry_after) if retry_after.isdigit() else (attempt + 1) * 10
                     self.logger.warning(
                         f"⚠️  Rate limit on page {page_num}! "
                         f"Waiting {wait_time}s... (Attempt {attempt + 1}/{max_retries})"
                     )
-                    time.sleep(wait_time)
+                    self._rate_limiter.pause(wait_time)
                 
                 elif response.status_code == 403:
                     # Forbidden - wait and retry
@@ -226,7 +476,7 @@ class EksiScraper:
                         f"⚠️  403 Forbidden on page {page_num}! "
                         f"Waiting {wait_time}s... (Attempt {attempt + 1}/{max_retries})"
                     )
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                 
                 elif response.status_code == 404:
                     # Not found - no point retrying
@@ -261,58 +511,100 @@ class EksiScraper:
         
         return None
     
-    def _parse_entries(self, html: str, page_num: int) -> List[Dict]:
+    def _apply_rate_limit_headers(self, headers) -> None:
+        """
+        Adjust the request rate to the budget advertised by the server.
+        
+        Uses X-RateLimit-Remaining / X-RateLimit-Reset when present (reset as
+        seconds or as a Unix timestamp); responses without them leave the
+        configured rate untouched. The server's budget can only slow requests
+        down - the configured delay stays the minimum gap between requests.
+        
+        Args:
+            headers: Response headers
+        """
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        
+        try:
+            remaining = int(remaining)
+            reset = float(reset)
+        except ValueError:
+            return
+        
+        # Large values are absolute timestamps rather than seconds-until-reset
+        window = reset - time.time() if reset > 1e9 else reset
+        window = max(window, 1.0)
+        
+        if remaining <= 0:
+            self.logger.warning(f"⚠️  Rate limit budget exhausted, pausing {window:.0f}s...")
+            self._rate_limiter.pause(window)
+        else:
+            self._rate_limiter.set_rate(min(remaining / window, self._max_request_rate))
+            self.logger.debug(f"⏱️  Rate limit: {remaining} requests left in {window:.0f}s")
+    
+    def _parse_entries(self, html: bytes, page_num: int) -> List[Dict]:
         """
         Parse entries from HTML content.
         
         Args:
-            html: HTML content to parse
+            html: Raw HTML bytes to parse (decoded by the parser itself)
             page_num: Page number (for reference)
             
         Returns:
             List of parsed entry dictionaries
         """
+        if self.fast_parse:
+            fast_entries = self._parse_entries_fast(html, page_num)
+            if fast_entries is not None:
+                return fast_entries
+            self.logger.debug(f"Fast parse did not match page {page_num}, using HTML parser")
+        
         entries = []
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            # Skip everything before the entry list container
+            match = _ENTRY_LIST_START_RE.search(html)
+            tree = LexborHTMLParser(html[match.start():] if match else html)
             
             # Find entry list container
-            entry_list = soup.find('ul', {'id': 'entry-item-list'})
+            entry_list = tree.css_first('ul#entry-item-list')
             if not entry_list:
                 self.logger.warning(f"⚠️  No entry list found on page {page_num}")
                 return entries
             
             # Find all entries
-            entry_items = entry_list.find_all('li', {'id': 'entry-item'})
+            entry_items = entry_list.css('li#entry-item')
             self.logger.info(f"📝 Found {len(entry_items)} entries on page {page_num}")
             
             # Parse each entry
             for item in entry_items:
                 try:
+                    attrs = item.attributes
+                    entry_id = attrs.get('data-id')
+                    author_id = attrs.get('data-author-id')
+                    
+                    # Numeric attributes are stored as ints once, at parse time
                     entry_data = {
-                        'entry_id': item.get('data-id'),
-                        'author': item.get('data-author'),
-                        'author_id': item.get('data-author-id'),
-                        'favorite_count': item.get('data-favorite-count', '0'),
+                        'entry_id': _to_int(entry_id),
+                        'author': attrs.get('data-author'),
+                        'author_id': _to_int(author_id),
+                        'favorite_count': _to_int(attrs.get('data-favorite-count'), 0),
                         'page_number': page_num,
                     }
                     
-                    # Extract content
-                    content_div = item.find('div', class_='content')
+                    # Extract content. Lexbor's text() walks the subtree in C; it
+                    # benchmarks ~10x faster than serializing the node and running
+                    # _fragment_text() over its HTML, so the DOM path keeps it.
+                    content_div = item.css_first('div.content')
                     if content_div:
-                        entry_data['content'] = content_div.get_text(strip=True)
+                        entry_data['content'] = content_div.text(strip=True)
                     
                     # Extract date
-                    footer = item.find('footer')
-                    if footer:
-                        date_link = footer.find('a', class_='entry-date')
-                        if date_link:
-                            entry_data['date'] = date_link.get_text(strip=True)
-                        else:
-                            entry_data['date'] = None
-                    else:
-                        entry_data['date'] = None
+                    date_link = item.css_first('footer a.entry-date')
+                    entry_data['date'] = date_link.text(strip=True) if date_link else None
                     
                     entries.append(entry_data)
                     
@@ -329,138 +621,518 @@ class EksiScraper:
         
         return entries
     
-    def _get_total_pages(self, base_url: str) -> int:
+    def _parse_entries_fast(self, html: bytes, page_num: int) -> Optional[List[Dict]]:
         """
-        Determine the total number of pages for a topic.
+        Parse entries with precompiled regexes on the raw bytes, without a DOM.
+        
+        Each entry block runs from its ``<li id="entry-item">`` start tag to the
+        next one, so nested lists inside an entry do not cut it short; the
+        last block ends where the entry list's ``</ul>`` closes it.
         
         Args:
-            base_url: Base topic URL
+            html: Raw HTML bytes to parse
+            page_num: Page number (for reference)
             
         Returns:
-            Total number of pages
+            List of parsed entry dictionaries, or None if the markup did not
+            match the expected layout (caller falls back to the HTML parser):
+            no entry start tags, an unclosed entry list, an entry without a
+            content div, content containing a nested div, or any parse error
         """
         try:
-            url = f"{base_url}?p=1"
-            response = requests.get(url, headers=self.headers, impersonate="chrome120", timeout=30)
+            starts = list(_ENTRY_START_RE.finditer(html))
+            if not starts:
+                return None
             
-            if response.status_code != 200:
-                self.logger.warning(
-                    f"⚠️  Could not determine page count (HTTP {response.status_code}). "
-                    "Assuming single page..."
-                )
-                return 1
+            # Find the entry list's closing tag after the last entry, skipping
+            # lists nested inside it (e.g. footer dropdown menus)
+            list_end = None
+            depth = 1
+            for tag in _UL_TAG_RE.finditer(html, starts[-1].end()):
+                depth += -1 if tag.group(1) else 1
+                if depth == 0:
+                    list_end = tag.start()
+                    break
+            if list_end is None:
+                return None
+            
+            entries = []
+            for i, start in enumerate(starts):
+                end = starts[i + 1].start() if i + 1 < len(starts) else list_end
+                block = html[start.end():end]
+                
+                # The lazy match stops at the first </div>, so content holding a
+                # nested div would be cut short - leave those to the HTML parser
+                content = _CONTENT_RE.search(block)
+                if not content or b'<div' in content.group(1):
+                    return None
+                
+                attrs = {
+                    name.decode(): html_lib.unescape(value.decode('utf-8', 'replace'))
+                    for name, value in _ATTR_RE.findall(start.group(1))
+                }
+                entry_id = attrs.get('data-id')
+                author_id = attrs.get('data-author-id')
+                footer = block.find(b'<footer')
+                date = _DATE_RE.search(block, footer) if footer != -1 else None
+                
+                entries.append({
+                    'entry_id': _to_int(entry_id),
+                    'author': attrs.get('data-author'),
+                    'author_id': _to_int(author_id),
+                    'favorite_count': _to_int(attrs.get('data-favorite-count'), 0),
+                    'page_number': page_num,
+                    'content': _fragment_text(content.group(1)),
+                    'date': _fragment_text(date.group(1)) if date else None,
+                })
+            
+        except Exception as e:
+            self.logger.debug(f"Fast parse error on page {page_num}: {str(e)}")
+            return None
+        
+        self.logger.info(f"📝 Found {len(entries)} entries on page {page_num}")
+        return entries
+    
+    async def _get_total_pages(self, base_url: str) -> Tuple[int, Optional[List[Dict]]]:
+        """
+        Determine the total number of pages for a topic.
+        
+        The first page is fetched only once: its entries are parsed here and
+        handed back so the scrape loop can start from page 2.
+        
+        Args:
+            base_url: Base topic URL
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+        Returns:
+            Tuple of (total number of pages, entries of page 1 or None if it could not be fetched)
+        """
+        url = f"{base_url}?p=1"
+        self.logger.info(f"\n📖 Processing page 1...")
+        self.logger.debug(f"🔗 URL: {url}")
+        
+        html = await self._fetch_page(url, 1)
+        if not html:
+            self.logger.warning("⚠️  Could not determine page count. Assuming single page...")
+            return 1, None
+        
+        entries = self._parse_entries(html, 1)
+        
+        try:
+            # Fast path: read the page count straight from the raw HTML
+            match = _PAGECOUNT_RE.search(html)
+            if match:
+                total_pages = int(match.group(1))
+                self.logger.info(f"📚 Topic has {total_pages} page(s)")
+                return total_pages, entries
             
-            # Look for pager element
-            pager = soup.find('div', class_='pager')
+            # Fallback: parse only the pager start tag
+            match = _PAGER_START_RE.search(html)
+            pager = None
+            if match:
+                end = html.find(b'>', match.start()) + 1
+                pager = LexborHTMLParser(html[match.start():end]).css_first('div.pager')
             if pager:
-                page_count = pager.get('data-pagecount')
+                page_count = pager.attributes.get('data-pagecount')
                 if page_count:
                     total_pages = int(page_count)
                     self.logger.info(f"📚 Topic has {total_pages} page(s)")
-                    return total_pages
+                    return total_pages, entries
             
             # No pager means single page
             self.logger.info("📄 Topic has 1 page")
-            return 1
+            return 1, entries
             
         except Exception as e:
             self.logger.error(f"❌ Error getting page count: {str(e)}")
             self.logger.info("📄 Assuming single page...")
-            return 1
+            return 1, entries
     
     def scrape(self, url: str) -> pd.DataFrame:
         """
         Main scraping method.
         
+        Pages are fetched concurrently over the scraper's shared curl_cffi
+        session; this call blocks until every page has been processed.
+        
         Args:
             url: Ekşi Sözlük topic URL to scrape
             
         Returns:
             DataFrame containing scraped entries
         """
-        # Reset state
+        page_results: Dict[int, List[Dict]] = {}
+        
+        def collect_page(page_num: int, page_entries: Optional[List[Dict]]) -> None:
+            if page_entries is not None:
+                page_results[page_num] = page_entries
+        
         self.entries = []
-        self.errors = []
+        if not self._run(self._scrape_async(url, collect_page)):
+            return pd.DataFrame()
+        
+        # Merge pages in order
+        entries = [entry for page_num in sorted(page_results) for entry in page_results[page_num]]
+        df = pd.DataFrame(entries)
+        
+        # Filter out entries without an ID and duplicates in one vectorized pass
+        if not df.empty:
+            keep = df['entry_id'].notna() & ~df.duplicated(subset='entry_id', keep='first')
+            # Nullable ints, so a missing author ID doesn't turn the column into floats
+            df = df[keep].reset_index(drop=True).astype({'entry_id': 'Int64', 'author_id': 'Int64'})
+            self.entries = list(compress(entries, keep))
+        
+        self._log_completion(len(self.entries), len(entries) - len(self.entries))
+        
+        # Return DataFrame
+        if self.entries:
+            return df
+        else:
+            self.logger.warning("⚠️  No entries found!")
+            return pd.DataFrame()
+    
+    def scrape_to_csv(self, url: str, filename: Optional[str] = None) -> Tuple[str, Optional[str]]:
+        """
+        Scrape a topic and stream its entries straight to a CSV file.
+        
+        Rows are written as pages are parsed instead of being collected in
+        memory, so memory use stays flat regardless of topic size. Pages that
+        finish early wait in a small buffer until every lower-numbered page is
+        written (or has failed), so rows keep page order, as in scrape(). Summary
+        statistics are kept as running totals; call get_summary() without a
+        DataFrame to read them.
+        
+        Args:
+            url: Ekşi Sözlük topic URL to scrape
+            filename: Optional filename (auto-generated if not provided)
+            
+        Returns:
+            Tuple of (data_filename, error_filename or None)
+        """
+        self.entries = []
+        self._author_counts = Counter()
+        self._streamed_entries = 0
+        self._streamed_favorites = 0
+        
         seen_entry_ids = set()  # Track unique entries
+        duplicate_count = 0
+        csv_file: Optional[IO[str]] = None
+        writer: Optional[csv.DictWriter] = None
+        open_failed = False
+        
+        # Pages finished ahead of the next page to write (None = fetch failed)
+        pending_pages: Dict[int, Optional[List[Dict]]] = {}
+        next_page = 1
+        
+        def buffer_page(page_num: int, page_entries: Optional[List[Dict]]) -> None:
+            nonlocal next_page
+            pending_pages[page_num] = page_entries
+            while next_page in pending_pages:
+                ready_entries = pending_pages.pop(next_page)
+                if ready_entries is not None:
+                    write_page(next_page, ready_entries)
+                next_page += 1
+        
+        def write_page(page_num: int, page_entries: List[Dict]) -> None:
+            nonlocal duplicate_count, csv_file, writer, open_failed, filename
+            unique_entries = self._filter_duplicates(page_entries, seen_entry_ids, page_num)
+            duplicate_count += len(page_entries) - len(unique_entries)
+            if not unique_entries or open_failed:
+                return
+            
+            # Open the file lazily, once the page count (used in the name) is known
+            if writer is None:
+                opened = self._open_csv(filename)
+                if opened is None:
+                    open_failed = True
+                    return
+                csv_file, filename = opened
+                writer = csv.DictWriter(csv_file, fieldnames=_ENTRY_FIELDS)
+                writer.writeheader()
+            
+            writer.writerows(unique_entries)
+            self._streamed_entries += len(unique_entries)
+            for entry in unique_entries:
+                if entry.get('author'):
+                    self._author_counts[entry['author']] += 1
+                self._streamed_favorites += entry['favorite_count']
+        
+        try:
+            if not self._run(self._scrape_async(url, buffer_page)):
+                return ("", None)
+        finally:
+            if csv_file is not None:
+                csv_file.close()
+        
+        self._log_completion(self._streamed_entries, duplicate_count)
+        
+        if open_failed:
+            return ("", None)
+        if csv_file is None:
+            self.logger.warning("⚠️  No entries found!")
+            return ("", None)
+        
+        self.logger.info(f"💾 Data saved to: {filename}")
+        return (filename, self._save_errors(filename))
+    
+    def _run(self, coro):
+        """
+        Run a coroutine to completion on the scraper's event loop.
+        """
+        if self._loop.is_closed():
+            coro.close()
+            raise RuntimeError("EksiScraper has been closed")
+        
+        return _run_on_loop(self._loop, coro)
+    
+    async def _scrape_async(self, url: str, on_page: Callable[[int, Optional[List[Dict]]], None]) -> bool:
+        """
+        Fetch and parse every page of a topic with bounded concurrency.
+        
+        Args:
+            url: Ekşi Sözlük topic URL to scrape
+            on_page: Called once per page with (page_num, entries), or with
+                (page_num, None) if the page could not be fetched; page 1 first
+                and the rest in completion order
+            
+        Returns:
+            False if the URL was rejected, True otherwise
+        """
+        # Reset state
+        self.errors = []
         
         # Clean and validate URL
         try:
             base_url = self._clean_url(url)
         except ValueError as e:
             self.logger.error(str(e))
-            return pd.DataFrame()
+            return False
         
         self.logger.info(f"🎯 Starting scrape: {base_url}")
-        self.logger.info(f"⚙️  Settings: delay={self.delay_seconds:.1f}s, verbose={self.verbose}")
+        self.logger.info(
+            f"⚙️  Settings: delay={self.delay_seconds:.1f}s, "
+            f"concurrency={self.concurrency}, verbose={self.verbose}"
+        )
 
         # Extract topic title for filename
         self.topic_title = self._extract_topic_title(base_url)
         self.logger.debug(f"📝 Topic title: {self.topic_title}")
 
-        # Get total pages
-        total_pages = self._get_total_pages(base_url)
-        self.total_pages = total_pages
-        
-        # Scrape each page
-        duplicate_count = 0
-        for page_num in range(1, total_pages + 1):
-            page_url = f"{base_url}?p={page_num}"
-            self.logger.info(f"\n📖 Processing page {page_num}/{total_pages}...")
-            self.logger.debug(f"🔗 URL: {page_url}")
+        # Configured pace: requests start at least `delay` apart (no bursts);
+        # concurrency only overlaps slow responses.
+        self._max_request_rate = 1 / self.delay_seconds if self.delay_seconds > 0 else math.inf
+        self._rate_limiter = TokenBucket(capacity=1, refill_rate=self._max_request_rate)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        tasks: List[asyncio.Task] = []
+        try:
+            # Get total pages (page 1 is fetched and parsed along the way)
+            total_pages, first_page_entries = await self._get_total_pages(base_url)
+            self.total_pages = total_pages
+            if first_page_entries is not None:
+                on_page(1, first_page_entries)
+            else:
+                self.logger.warning(f"⚠️  Skipping page 1 (fetch failed)")
+                on_page(1, None)
             
-            # Fetch page
-            html = self._fetch_page(page_url, page_num)
-            if html:
-                # Parse entries
-                page_entries = self._parse_entries(html, page_num)
+            async def process_page(page_num: int) -> None:
+                page_url = f"{base_url}?p={page_num}"
+                self.logger.info(f"\n📖 Processing page {page_num}/{total_pages}...")
+                self.logger.debug(f"🔗 URL: {page_url}")
                 
-                # Filter out duplicates
-                unique_entries = []
-                for entry in page_entries:
-                    if entry.get('entry_id') and entry['entry_id'] not in seen_entry_ids:
-                        seen_entry_ids.add(entry['entry_id'])
-                        unique_entries.append(entry)
-                    else:
-                        duplicate_count += 1
-                
-                if unique_entries:
-                    self.logger.info(f"✅ Added {len(unique_entries)} unique entries from page {page_num}")
+                # Fetch page
+                html = await self._fetch_page(page_url, page_num)
+                if html:
+                    # Parse entries
+                    on_page(page_num, self._parse_entries(html, page_num))
                 else:
-                    self.logger.warning(f"⚠️  No new entries on page {page_num} (all duplicates)")
-                
-                self.entries.extend(unique_entries)
-            else:
-                self.logger.warning(f"⚠️  Skipping page {page_num} (fetch failed)")
+                    self.logger.warning(f"⚠️  Skipping page {page_num} (fetch failed)")
+                    on_page(page_num, None)
+            
+            # Submit the remaining pages at once; the semaphore in _fetch_page
+            # bounds how many requests share the connection at a time
+            tasks = [asyncio.create_task(process_page(page_num)) for page_num in range(2, total_pages + 1)]
+            await asyncio.gather(*tasks)
+        finally:
+            # If a page failed (e.g. on_page raised), stop the others here so
+            # they don't resume on this loop during the next scrape
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._semaphore = None
+            self._rate_limiter = None
+        
+        return True
+    
+    def _filter_duplicates(self, page_entries: List[Dict], seen_entry_ids: set, page_num: int) -> List[Dict]:
+        """
+        Drop entries already seen on earlier pages (or lacking an ID).
+        
+        Args:
+            page_entries: Entries parsed from one page
+            seen_entry_ids: Entry IDs seen so far; updated in place
+            page_num: Page number (for logging)
+            
+        Returns:
+            List of entries not seen before
+        """
+        unique_entries = [
+            entry for entry in page_entries
+            if entry['entry_id'] and entry['entry_id'] not in seen_entry_ids
+        ]
+        seen_entry_ids.update(entry['entry_id'] for entry in unique_entries)
         
-        # Summary
+        if unique_entries:
+            self.logger.info(f"✅ Added {len(unique_entries)} unique entries from page {page_num}")
+        else:
+            self.logger.warning(f"⚠️  No new entries on page {page_num} (all duplicates)")
+        
+        return unique_entries
+    
+    def _log_completion(self, total_entries: int, duplicate_count: int) -> None:
+        """
+        Log the end-of-scrape summary.
+        """
         self.logger.info(f"\n✨ Scraping completed!")
-        self.logger.info(f"📊 Total unique entries: {len(self.entries)}")
+        self.logger.info(f"📊 Total unique entries: {total_entries}")
         if duplicate_count > 0:
             self.logger.info(f"🔄 Duplicate entries filtered: {duplicate_count}")
         if self.errors:
             self.logger.info(f"⚠️  Errors encountered: {len(self.errors)}")
+    
+    def close(self) -> None:
+        """
+        Close the HTTP session and release its connections.
+        """
+        self._finalizer()
+    
+    def __enter__(self) -> 'EksiScraper':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _default_filename(self, extension: str = 'csv') -> str:
+        """
+        Build the output filename: data/baslikismi_sayfasayisi_tarih.<extension>
         
-        # Create DataFrame
-        if self.entries:
-            df = pd.DataFrame(self.entries)
-            return df
-        else:
-            self.logger.warning("⚠️  No entries found!")
-            return pd.DataFrame()
+        Args:
+            extension: File extension without the leading dot
+        
+        Returns:
+            Generated filename (error fallback name if generation fails)
+        """
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+        # Try to create filename with topic title and page count
+        try:
+            if self.topic_title and self.total_pages > 0:
+                # Format: data/baslikismi_sayfasayisi_tarih.csv
+                filename = f'data/{self.topic_title}_{self.total_pages}sayfa_{timestamp}.{extension}'
+                self.logger.debug(f"📝 Generated filename: {filename}")
+            else:
+                # Fallback to default format
+                filename = f'data/eksisozluk_entries_{timestamp}.{extension}'
+                self.logger.debug(f"📝 Using default filename: {filename}")
+
+        except Exception as e:
+            # If anything goes wrong, use error fallback filename
+            self.logger.error(f"❌ Error generating filename: {str(e)}")
+            filename = f'data/error_{timestamp}.{extension}'
+            self.logger.warning(f"⚠️  Using error fallback filename: {filename}")
+
+        return filename
     
-    def save_to_csv(self, df: pd.DataFrame, filename: Optional[str] = None) -> Tuple[str, Optional[str]]:
+    def _open_csv(self, filename: Optional[str]) -> Optional[Tuple[IO[str], str]]:
+        """
+        Open a CSV file for streaming, falling back to an error filename.
+        
+        Filenames ending in .gz are written gzip-compressed.
+        
+        Args:
+            filename: Target filename (auto-generated if None)
+            
+        Returns:
+            Tuple of (open file, filename actually used), or None if both attempts failed
         """
-        Save DataFrame to CSV file with format: baslikismi_sayfasayisi_tarih.csv
+        # Ensure data directory exists
+        Path('data').mkdir(exist_ok=True)
+
+        if filename is None:
+            filename = self._default_filename()
+
+        try:
+            return (self._open_text(filename), filename)
+        except Exception as e:
+            # If opening fails, try with error fallback filename
+            self.logger.error(f"❌ Error saving to {filename}: {str(e)}")
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            filename = f'data/error_{timestamp}.csv'
+            try:
+                handle = self._open_text(filename)
+                self.logger.info(f"💾 Saving to fallback file: {filename}")
+                return (handle, filename)
+            except Exception as e2:
+                self.logger.error(f"❌ Critical error: Could not save file: {str(e2)}")
+                return None
+    
+    @staticmethod
+    def _open_text(filename: str) -> IO[str]:
+        """
+        Open a text file for CSV writing, gzip-compressed if it ends in .gz.
+        """
+        if filename.endswith('.gz'):
+            return gzip.open(filename, 'wt', newline='', encoding='utf-8-sig')
+        return open(filename, 'w', newline='', encoding='utf-8-sig')
+    
+    def _save_errors(self, filename: str) -> Optional[str]:
+        """
+        Save collected errors next to the data file.
+        
+        Args:
+            filename: Data filename the error filename is derived from
+            
+        Returns:
+            Error filename, or None if there were no errors or saving failed
+        """
+        if not self.errors:
+            return None
+
+        try:
+            error_filename = _DATA_SUFFIX_RE.sub('_errors.csv', filename, count=1)
+            error_df = pd.DataFrame(self.errors)
+            error_df.to_csv(error_filename, index=False, encoding='utf-8-sig')
+            self.logger.info(f"📝 Errors saved to: {error_filename}")
+            return error_filename
+        except Exception as e:
+            self.logger.error(f"❌ Error saving error log: {str(e)}")
+            return None
+    
+    def save_to_csv(
+        self,
+        df: pd.DataFrame,
+        filename: Optional[str] = None,
+        format: Literal['csv', 'parquet', 'feather'] = 'csv'
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Save DataFrame to file with format: baslikismi_sayfasayisi_tarih.<format>
+
+        CSV compression is inferred from the filename (e.g. ``.csv.gz``).
+        Parquet and Feather are written zstd-compressed and require pyarrow.
 
         Args:
             df: DataFrame to save
             filename: Optional filename (auto-generated if not provided)
+            format: Output format: 'csv' (default), 'parquet' or 'feather'
 
         Returns:
             Tuple of (data_filename, error_filename or None)
         """
+        if format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Invalid format: {format}. Must be one of: {', '.join(OUTPUT_FORMATS)}."
+            )
+        if format != 'csv' and not _has_pyarrow():
+            raise ImportError(f"Saving as {format} requires pyarrow: pip install pyarrow")
+
         if df.empty:
             self.logger.warning("⚠️  No data to save!")
             return ("", None)
@@ -470,66 +1142,62 @@ class EksiScraper:
         data_dir.mkdir(exist_ok=True)
 
         # Generate filename if not provided
+        extension = OUTPUT_FORMATS[format]
         if filename is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-
-            # Try to create filename with topic title and page count
-            try:
-                if self.topic_title and self.total_pages > 0:
-                    # Format: data/baslikismi_sayfasayisi_tarih.csv
-                    filename = f'data/{self.topic_title}_{self.total_pages}sayfa_{timestamp}.csv'
-                    self.logger.debug(f"📝 Generated filename: {filename}")
-                else:
-                    # Fallback to default format
-                    filename = f'data/eksisozluk_entries_{timestamp}.csv'
-                    self.logger.debug(f"📝 Using default filename: {filename}")
-
-            except Exception as e:
-                # If anything goes wrong, use error fallback filename
-                self.logger.error(f"❌ Error generating filename: {str(e)}")
-                filename = f'data/error_{timestamp}.csv'
-                self.logger.warning(f"⚠️  Using error fallback filename: {filename}")
+            filename = self._default_filename(extension)
 
         # Save main data with error handling
         try:
-            df.to_csv(filename, index=False, encoding='utf-8-sig')
+            self._write_frame(df, filename, format)
             self.logger.info(f"💾 Data saved to: {filename}")
         except Exception as e:
             # If saving fails, try with error fallback filename
             self.logger.error(f"❌ Error saving to {filename}: {str(e)}")
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f'data/error_{timestamp}.csv'
+            filename = f'data/error_{timestamp}.{extension}'
             try:
-                df.to_csv(filename, index=False, encoding='utf-8-sig')
+                self._write_frame(df, filename, format)
                 self.logger.info(f"💾 Data saved to fallback file: {filename}")
             except Exception as e2:
                 self.logger.error(f"❌ Critical error: Could not save file: {str(e2)}")
                 return ("", None)
 
         # Save errors if any
-        error_filename = None
-        if self.errors:
-            try:
-                error_filename = filename.replace('.csv', '_errors.csv')
-                error_df = pd.DataFrame(self.errors)
-                error_df.to_csv(error_filename, index=False, encoding='utf-8-sig')
-                self.logger.info(f"📝 Errors saved to: {error_filename}")
-            except Exception as e:
-                self.logger.error(f"❌ Error saving error log: {str(e)}")
-                error_filename = None
+        error_filename = self._save_errors(filename)
 
         return (filename, error_filename)
     
-    def get_summary(self, df: pd.DataFrame) -> Dict:
+    @staticmethod
+    def _write_frame(df: pd.DataFrame, filename: str, format: str) -> None:
+        """
+        Write a DataFrame in the given output format.
+        """
+        if format == 'parquet':
+            df.to_parquet(filename, index=False, compression='zstd')
+        elif format == 'feather':
+            df.to_feather(filename, compression='zstd')
+        else:
+            df.to_csv(filename, index=False, encoding='utf-8-sig', chunksize=_CSV_CHUNKSIZE)
+    
+    def get_summary(self, df: Optional[pd.DataFrame] = None) -> Dict:
         """
         Get summary statistics from scraped data.
         
         Args:
-            df: DataFrame with scraped entries
+            df: DataFrame with scraped entries. If omitted, the running totals
+                of the last scrape_to_csv() call are used.
             
         Returns:
             Dictionary with summary statistics
         """
+        if df is None:
+            return {
+                'total_entries': self._streamed_entries,
+                'unique_authors': len(self._author_counts),
+                'total_favorites': self._streamed_favorites,
+                'top_authors': dict(self._author_counts.most_common(5))
+            }
+        
         if df.empty:
             return {
                 'total_entries': 0,
@@ -541,7 +1209,7 @@ class EksiScraper:
         return {
             'total_entries': len(df),
             'unique_authors': df['author'].nunique(),
-            'total_favorites': df['favorite_count'].astype(int).sum(),
+            'total_favorites': df['favorite_count'].sum(),
             'top_authors': df['author'].value_counts().head(5).to_dict()
         }
 
@@ -551,8 +1219,8 @@ def main():
     Main CLI entry point.
     """
     # Set UTF-8 encoding for stdout to support emojis on Windows
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    # (shared with the logger's console handler)
+    sys.stdout = _console_stream()
 
     # Set up argument parser
     parser = argparse.ArgumentParser(
@@ -570,7 +1238,21 @@ def main():
         '--delay',
         type=int,
         default=2000,
-        help='Delay between requests in milliseconds (default: 2000ms)'
+        help='Minimum delay between request starts in milliseconds (default: 2000ms, i.e. at most 0.5 requests/s)'
+    )
+    
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=8,
+        help='Maximum number of requests in flight; overlaps slow responses, does not raise the request rate (default: 8)'
+    )
+    
+    parser.add_argument(
+        '--fast-parse',
+        action='store_true',
+        help='Extract entries with regular expressions instead of the HTML parser '
+             '(falls back automatically if the page layout does not match)'
     )
     
     parser.add_argument(
@@ -583,7 +1265,14 @@ def main():
         '--output',
         '-o',
         type=str,
-        help='Output CSV filename (auto-generated if not specified)'
+        help='Output filename (auto-generated if not specified, .csv.gz compresses CSV output)'
+    )
+    
+    parser.add_argument(
+        '--format',
+        choices=list(OUTPUT_FORMATS),
+        default='csv',
+        help='Output format (default: csv). parquet and feather require pyarrow'
     )
     
     # Parse arguments
@@ -599,22 +1288,33 @@ def main():
         print("❌ Error: No URL provided!")
         sys.exit(1)
     
+    # Check optional dependencies before spending time on the scrape
+    if args.format != 'csv' and not _has_pyarrow():
+        print(f"❌ Error: --format {args.format} requires pyarrow (pip install pyarrow)")
+        sys.exit(1)
+    
     # Create scraper instance
     scraper = EksiScraper(
         delay_ms=args.delay,
-        verbose=not args.silent
+        verbose=not args.silent,
+        concurrency=args.concurrency,
+        fast_parse=args.fast_parse
     )
     
     # Perform scraping
     print(f"\n🚀 Starting scraper...")
-    df = scraper.scrape(url)
+    with scraper:
+        if args.format == 'csv':
+            # Entries are written to the CSV file page by page
+            data_file, error_file = scraper.scrape_to_csv(url, args.output)
+            summary = scraper.get_summary()
+        else:
+            df = scraper.scrape(url)
+            data_file, error_file = scraper.save_to_csv(df, args.output, format=args.format)
+            summary = scraper.get_summary(df)
     
-    # Save results
-    if not df.empty:
-        data_file, error_file = scraper.save_to_csv(df, args.output)
-        
+    if data_file:
         # Display summary
-        summary = scraper.get_summary(df)
         
         print("\n" + "=" * 60)
         print("📊 SCRAPING SUMMARY")